@@ -1,27 +1,120 @@
+import asyncio
+import functools
+import httpx
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
 import argparse
+import atexit
+import html
+import json
 from urllib.parse import quote_plus
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
-from datetime import datetime
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from datetime import datetime, timedelta
+
+try:
+    import lxml.etree
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    # orjson is a much faster drop-in for json.loads and accepts bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 def get_best_parser():
-    try:
-        import lxml
+    if HAS_LXML:
         return 'lxml'
-    except ImportError:
-        print("Note: lxml is not installed. Using standard HTML parser instead.")
-        print("For better performance, consider installing lxml via:")
-        print("pip install lxml==4.9.3")
-        return 'html.parser'
+    print("Note: lxml is not installed. Using standard HTML parser instead.")
+    print("For better performance, consider installing lxml via:")
+    print("pip install lxml")
+    return 'html.parser'
+
+# The search results, title and rating widget all sit well inside the first 256 KB.
+# Only the HTTP/2 path stops downloading there; the cached requests session reads whole
+# bodies into the cache, so on that path the limit just caps what is handed to the parser.
+MAX_PAGE_BYTES = 256 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+async def _read_page_prefix_async(response, limit=MAX_PAGE_BYTES):
+    """Read at most `limit` decoded bytes from a streamed httpx response"""
+    chunks, size = [], 0
+    async for chunk in response.aiter_bytes(chunk_size=READ_CHUNK_BYTES):
+        if size < limit:
+            chunks.append(chunk)
+            size += len(chunk)
+        elif response.http_version == "HTTP/2":
+            # Closing early only resets this stream; the connection stays usable
+            break
+        # On HTTP/1.1 keep draining so the connection goes back to the pool
+    return b"".join(chunks)[:limit]
+
+# Minimum spacing between two network requests to IMDb, in seconds
+MIN_REQUEST_INTERVAL = 0.5
+
+# Retry policy shared by the requests session and the async HTTP/2 client
+RETRY_TOTAL = 2
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+@functools.lru_cache(maxsize=None)
+def _excel_styles():
+    """Excel styling shared by every cell; openpyxl is only imported once something is saved"""
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    return {
+        'border': Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        ),
+        'header_font': Font(name='Arial', size=12, bold=True, color="FFFFFF"),
+        'header_fill': PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid"),
+        'header_alignment': Alignment(horizontal='center', vertical='center')
+    }
+
+# Titles, ratings, genre lists and title URLs all have predictable maximum lengths
+COLUMN_WIDTHS = {'A': 40, 'B': 10, 'C': 35, 'D': 45}
+
+def _xpath_class(name):
+    """XPath predicate matching one token of a space-separated class attribute"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Selectors are compiled once at import instead of on every page
+_SEL_ITEMS = soupsieve.compile('li.ipc-metadata-list-summary-item')
+_SEL_TITLE_LINK = soupsieve.compile('a.ipc-metadata-list-summary-item__t')
+_SEL_RATING = soupsieve.compile('[data-testid="hero-rating-bar__aggregate-rating__score"] span:first-child')
+_SEL_TITLE = soupsieve.compile('h1[data-testid="hero__pageTitle"] span')
+_SEL_GENRES = soupsieve.compile('div.ipc-chip-list__scroller span.ipc-chip__text')
+_SEL_JSON_LD = soupsieve.compile('script[type="application/ld+json"]')
+
+if HAS_LXML:
+    # IMDb always serves UTF-8; without this lxml guesses and falls back to Latin-1
+    _HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+    _XP_ITEMS = lxml.etree.XPath(f'//li[{_xpath_class("ipc-metadata-list-summary-item")}]')
+    _XP_TITLE_LINK = lxml.etree.XPath(f'.//a[{_xpath_class("ipc-metadata-list-summary-item__t")}]')
+    _XP_RATING = lxml.etree.XPath('//*[@data-testid="hero-rating-bar__aggregate-rating__score"]/span[1]/text()')
+    _XP_TITLE = lxml.etree.XPath('//h1[@data-testid="hero__pageTitle"]//span/text()')
+    _XP_JSON_LD = lxml.etree.XPath('//script[@type="application/ld+json"]/text()')
+    _XP_GENRES = lxml.etree.XPath(
+        f'//div[{_xpath_class("ipc-chip-list__scroller")}]//span[{_xpath_class("ipc-chip__text")}]/text()'
+    )
 
 class IMDBSeriesScraper:
     def __init__(self, excel_file="imdb_series_data.xlsx"):
         self.base_url = "https://www.imdb.com"
         self.search_url = "https://www.imdb.com/find?q="
+        self.suggestion_url = "https://v2.sg.media-imdb.com/suggestion"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -31,35 +124,268 @@ class IMDBSeriesScraper:
         self.excel_file = excel_file
         self.html_parser = get_best_parser()
 
-    def search_series(self, query):
-        """Search for a series on IMDb and return potential matches"""
+        # One pooled session so the search and detail requests reuse a keep-alive connection;
+        # responses are cached on disk so repeated lookups skip the network entirely
+        self.session = requests_cache.CachedSession(
+            cache_name='imdb_cache',
+            backend='sqlite',
+            expire_after=timedelta(hours=12),
+            allowable_methods=('GET',),
+            stale_if_error=True
+        )
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES)
+        )
+        self.session.mount("https://", adapter)
+        self._last_request = 0.0
+        self._throttle_lock = threading.Lock()
+        # State for the concurrent lookups; the pool parses pages off the event loop
+        self._async_next_request = 0.0
+        self._parse_executor = ThreadPoolExecutor(max_workers=8)
+        # Lookups already done in this run, keyed by the case-folded series name
+        self._cache = {}
+        
+        # The workbook stays open across writes and is saved once on close (or at exit)
+        self._wb = None
+        self._ws = None
+        self._existing_urls = None
+        self._dirty = False
+        self._flush_at_exit = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Save pending Excel rows and release the pooled HTTP connections and parse threads"""
+        self.flush_excel()
+        if self._flush_at_exit:
+            atexit.unregister(self.flush_excel)
+            self._flush_at_exit = False
+        self.session.close()
+        self._parse_executor.shutdown()
+
+    def _throttle(self, url, min_interval=MIN_REQUEST_INTERVAL):
+        """Space out network requests; fresh cached responses go through immediately"""
+        # Expired entries are kept for stale_if_error but still go to IMDb, so they are throttled
+        cached = self.session.cache.get_response(self._cache_key(url))
+        if cached is not None and not cached.is_expired:
+            return
+        with self._throttle_lock:
+            delta = time.monotonic() - self._last_request
+            if delta < min_interval:
+                time.sleep(min_interval - delta)
+            self._last_request = time.monotonic()
+
+    async def _throttle_async(self, min_interval=MIN_REQUEST_INTERVAL):
+        """Space out requests issued by concurrent lookups"""
+        # Reserve the next free slot before awaiting; nothing can interleave between
+        # the read and the update on the event loop, so no lock is needed
+        now = time.monotonic()
+        start = max(now, self._async_next_request)
+        self._async_next_request = start + min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _cache_key(self, url):
+        return self.session.cache.create_key(requests.Request('GET', url))
+
+    def _store_in_cache(self, url, response, content):
+        """Save an httpx response body in the same disk cache the requests session uses"""
+        # The body is already decoded (and possibly just a prefix), so drop the transfer headers
+        headers = CaseInsensitiveDict({
+            k: v for k, v in response.headers.items()
+            if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        })
+        cached = requests_cache.CachedResponse(
+            content=content,
+            headers=headers,
+            status_code=response.status_code,
+            url=str(response.url),
+            request=requests_cache.CachedRequest(method='GET', url=url)
+        )
+        expires = requests_cache.get_expiration_datetime(self.session.settings.expire_after)
+        self.session.cache.save_response(cached, cache_key=self._cache_key(url), expires=expires)
+
+    async def _fetch_async(self, client, url, limit=None):
+        """GET `url` through the shared disk cache, retrying the same statuses as the requests session"""
+        cached = self.session.cache.get_response(self._cache_key(url))
+        if cached is not None and not cached.is_expired:
+            return cached.content[:limit] if limit else cached.content
+        
         try:
-            print(f"\nSearching IMDb for: '{query}'...")
-            search_response = requests.get(
-                f"{self.search_url}{quote_plus(query)}&s=tt&ttype=tv",
-                headers=self.headers,
-                timeout=10
-            )
-            search_response.raise_for_status()
-            
-            soup = BeautifulSoup(search_response.text, self.html_parser)
+            for attempt in range(RETRY_TOTAL + 1):
+                await self._throttle_async()
+                async with client.stream('GET', url) as response:
+                    if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                        response.raise_for_status()
+                        content = await _read_page_prefix_async(response, limit) if limit else await response.aread()
+                        self._store_in_cache(url, response, content)
+                        return content
+                await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+        except httpx.HTTPError:
+            # Same as stale_if_error on the requests session
+            if cached is not None:
+                return cached.content[:limit] if limit else cached.content
+            raise
+
+    def _search_page_url(self, query):
+        return f"{self.search_url}{quote_plus(query)}&s=tt&ttype=tv"
+
+    def _suggestion_api_url(self, query):
+        first = query[0].lower() if query[0].isalnum() else 'x'
+        return f"{self.suggestion_url}/{first}/{quote_plus(query.lower().replace(' ', '_'))}.json"
+
+    def _parse_suggestions(self, data):
+        """Turn an IMDb suggestion API payload into up to five series matches"""
+        results = [
+            {'title': d['l'], 'url': f"{self.base_url}/title/{d['id']}/"}
+            for d in data.get('d', [])
+            if d.get('id', '').startswith('tt') and d.get('qid') in ('tvSeries', 'tvMiniSeries')
+        ][:5]
+        return results if results else None
+
+    def _parse_search_results(self, content):
+        """Extract up to five (title, url) matches from an IMDb search page"""
+        if HAS_LXML:
+            tree = lxml.html.fromstring(content, parser=_HTML_PARSER)
             results = []
-            
-            result_items = soup.find_all('li', class_='ipc-metadata-list-summary-item')
-            
-            for item in result_items[:5]:  
-                title_element = item.find('a', class_='ipc-metadata-list-summary-item__t')
+            for item in _XP_ITEMS(tree)[:5]:
+                title_element = _XP_TITLE_LINK(item)
                 if not title_element:
                     continue
-                    
-                title = title_element.text.strip()
-                link = title_element['href'].split('?')[0]
+                
+                link = title_element[0].get('href', '').split('?')[0]
                 results.append({
-                    'title': title,
+                    'title': title_element[0].text_content().strip(),
                     'url': f"{self.base_url}{link}"
                 })
-                
             return results if results else None
+
+        # IMDb always serves UTF-8; decode here so a prefix cut mid-character doesn't
+        # send BeautifulSoup off guessing the encoding
+        soup = BeautifulSoup(content.decode('utf-8', errors='replace'), self.html_parser)
+        results = []
+        
+        result_items = _SEL_ITEMS.select(soup, limit=5)
+        
+        for item in result_items:  
+            title_element = _SEL_TITLE_LINK.select_one(item)
+            if not title_element:
+                continue
+                
+            title = title_element.text.strip()
+            link = title_element['href'].split('?')[0]
+            results.append({
+                'title': title,
+                'url': f"{self.base_url}{link}"
+            })
+            
+        return results if results else None
+
+    def _details_from_json_ld(self, raw, series_url):
+        """Read title, rating and genres from the page's JSON-LD block, or None if unusable"""
+        try:
+            # lxml and BeautifulSoup hand back str subclasses, which orjson rejects
+            meta = json_loads(str(raw))
+            title = meta.get('name')
+            if not title:
+                return None
+            rating = (meta.get('aggregateRating') or {}).get('ratingValue', "N/A")
+            genres = meta.get('genre')
+            genres = ", ".join(genres[:3]) if isinstance(genres, list) else (genres or "N/A")
+            return {
+                'title': html.unescape(title),
+                'rating': str(rating),
+                'url': series_url,
+                'genres': genres
+            }
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def _parse_series_details(self, content, series_url):
+        """Extract title, rating and genres from an IMDb title page"""
+        if HAS_LXML:
+            # Only a handful of nodes are needed, so skip building a BeautifulSoup tree
+            tree = lxml.html.fromstring(content, parser=_HTML_PARSER)
+            scripts = _XP_JSON_LD(tree)
+            details = self._details_from_json_ld(scripts[0], series_url) if scripts else None
+            if details:
+                return details
+            
+            rating = (_XP_RATING(tree) or ["N/A"])[0].strip()
+            title = (_XP_TITLE(tree) or ["Unknown Title"])[0]
+            genres = ", ".join(_XP_GENRES(tree)[:3]) or "N/A"
+            return {
+                'title': title,
+                'rating': rating,
+                'url': series_url,
+                'genres': genres
+            }
+
+        soup = BeautifulSoup(content.decode('utf-8', errors='replace'), self.html_parser)
+        
+        script = _SEL_JSON_LD.select_one(soup)
+        details = self._details_from_json_ld(script.string, series_url) if script and script.string else None
+        if details:
+            return details
+        
+        rating_element = _SEL_RATING.select_one(soup)
+        rating = rating_element.text.strip() if rating_element else "N/A"
+        
+        title_element = _SEL_TITLE.select_one(soup)
+        title = title_element.text if title_element else "Unknown Title"
+        
+        genre_elements = _SEL_GENRES.select(soup, limit=3)
+        genres = ", ".join([genre.text for genre in genre_elements]) if genre_elements else "N/A"
+        
+        return {
+            'title': title,
+            'rating': rating,
+            'url': series_url,
+            'genres': genres
+        }
+
+    def _pick_first_result(self, series_name, search_results):
+        """Report the search matches and return the URL of the top one"""
+        if not search_results:
+            print(f"\n❌ No results found for '{series_name}'")
+            return None
+            
+        print(f"\n🔍 Found {len(search_results)} results for '{series_name}':")
+        for i, result in enumerate(search_results, 1):
+            print(f"{i}. {result['title']}")
+        
+        print("\nFetching rating for the first result...")
+        return search_results[0]['url']
+
+    def search_series(self, query):
+        """Search for a series on IMDb and return potential matches"""
+        print(f"\nSearching IMDb for: '{query}'...")
+        # The JSON suggestion API is a few KB; the HTML search page is only a fallback
+        try:
+            suggestion_url = self._suggestion_api_url(query)
+            self._throttle(suggestion_url)
+            suggestion_response = self.session.get(suggestion_url, timeout=10)
+            suggestion_response.raise_for_status()
+            results = self._parse_suggestions(json_loads(suggestion_response.content))
+            if results:
+                return results
+        except (requests.RequestException, ValueError, KeyError, IndexError, AttributeError, TypeError) as e:
+            print(f"Suggestion API unavailable ({str(e)}), falling back to the search page")
+        
+        try:
+            search_url = self._search_page_url(query)
+            self._throttle(search_url)
+            search_response = self.session.get(search_url, timeout=10)
+            search_response.raise_for_status()
+            
+            return self._parse_search_results(search_response.content[:MAX_PAGE_BYTES])
             
         except Exception as e:
             print(f"Search error: {str(e)}")
@@ -69,27 +395,11 @@ class IMDBSeriesScraper:
         """Get the rating for a specific series"""
         try:
             print(f"Fetching details from: {series_url}")
-            time.sleep(1)  
-            series_response = requests.get(series_url, headers=self.headers, timeout=10)
+            self._throttle(series_url)
+            series_response = self.session.get(series_url, timeout=10)
             series_response.raise_for_status()
             
-            soup = BeautifulSoup(series_response.text, self.html_parser)
-            
-            rating_element = soup.select_one('[data-testid="hero-rating-bar__aggregate-rating__score"] span:first-child')
-            rating = rating_element.text.strip() if rating_element else "N/A"
-            
-            title_element = soup.select_one('h1[data-testid="hero__pageTitle"] span')
-            title = title_element.text if title_element else "Unknown Title"
-            
-            genre_elements = soup.select('div.ipc-chip-list__scroller span.ipc-chip__text')
-            genres = ", ".join([genre.text for genre in genre_elements[:3]]) if genre_elements else "N/A"
-            
-            return {
-                'title': title,
-                'rating': rating,
-                'url': series_url,
-                'genres': genres
-            }
+            return self._parse_series_details(series_response.content[:MAX_PAGE_BYTES], series_url)
             
         except Exception as e:
             print(f"Rating fetch error: {str(e)}")
@@ -97,91 +407,192 @@ class IMDBSeriesScraper:
 
     def get_series_rating_by_name(self, series_name):
         """Search for a series by name and return its rating"""
-        search_results = self.search_series(series_name)
+        key = series_name.strip().casefold()
+        if key in self._cache:
+            return self._cache[key]
         
-        if not search_results:
-            print(f"\n❌ No results found for '{series_name}'")
+        series_url = self._pick_first_result(series_name, self.search_series(series_name))
+        result = self.get_series_rating(series_url) if series_url else None
+        # Failed lookups (timeouts, 5xx) are not cached so a later call can retry
+        if result:
+            self._cache[key] = result
+        return result
+
+    async def _search_async(self, client, query):
+        """Async counterpart of search_series using a shared HTTP/2 client"""
+        print(f"\nSearching IMDb for: '{query}'...")
+        try:
+            content = await self._fetch_async(client, self._suggestion_api_url(query))
+            results = self._parse_suggestions(json_loads(content))
+            if results:
+                return results
+        except (httpx.HTTPError, ValueError, KeyError, IndexError, AttributeError, TypeError) as e:
+            print(f"Suggestion API unavailable ({str(e)}), falling back to the search page")
+        
+        try:
+            content = await self._fetch_async(client, self._search_page_url(query), MAX_PAGE_BYTES)
+            
+            # Parse on a worker thread so one page's parse overlaps the other downloads
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._parse_executor, self._parse_search_results, content)
+            
+        except Exception as e:
+            print(f"Search error: {str(e)}")
             return None
+
+    async def _rating_async(self, client, series_url):
+        """Async counterpart of get_series_rating using a shared HTTP/2 client"""
+        try:
+            print(f"Fetching details from: {series_url}")
+            content = await self._fetch_async(client, series_url, MAX_PAGE_BYTES)
             
-        print(f"\n🔍 Found {len(search_results)} results:")
-        for i, result in enumerate(search_results, 1):
-            print(f"{i}. {result['title']}")
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._parse_executor, self._parse_series_details, content, series_url)
+            
+        except Exception as e:
+            print(f"Rating fetch error: {str(e)}")
+            return None
+
+    async def _rating_by_name_async(self, client, series_name):
+        key = series_name.strip().casefold()
+        if key in self._cache:
+            return self._cache[key]
         
-        print("\nFetching rating for the first result...")
-        return self.get_series_rating(search_results[0]['url'])
+        series_url = self._pick_first_result(series_name, await self._search_async(client, series_name))
+        result = await self._rating_async(client, series_url) if series_url else None
+        if result:
+            self._cache[key] = result
+        return result
+
+    async def _get_many_async(self, series_names, on_result=None):
+        # Transport-level retries cover connection failures; _fetch_async retries bad statuses
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=RETRY_TOTAL,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        # HTTP/2 multiplexes every lookup over a few connections; each lookup issues its
+        # requests one after another, so 4 lookups at a time means at most 4 in flight
+        slots = asyncio.Semaphore(4)
+        
+        async def lookup(client, series_name):
+            async with slots:
+                result = await self._rating_by_name_async(client, series_name)
+            if on_result is not None:
+                on_result(series_name, result)
+            return result
+        
+        async with httpx.AsyncClient(transport=transport, headers=self.headers, timeout=10.0,
+                                     follow_redirects=True) as client:
+            tasks = [lookup(client, name) for name in series_names]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_many_series_ratings(self, series_names, on_result=None):
+        """Look up several series concurrently; results keep the input order.
+
+        `on_result(series_name, result)` is called as soon as each lookup finishes.
+        """
+        return asyncio.run(self._get_many_async(series_names, on_result))
     
     def save_to_excel(self, data):
         """Save data to Excel file, appending if file exists"""
+        return self.save_many_to_excel([data]) > 0
+
+    def _bordered_cells(self, ws, values):
+        from openpyxl.cell import WriteOnlyCell
+        border = _excel_styles()['border']
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.border = border
+            cells.append(cell)
+        return cells
+
+    def _open_workbook(self):
+        """Load or create the workbook once and keep it for the rest of the run"""
+        if self._wb is not None:
+            return
+        from openpyxl import Workbook, load_workbook
+        
+        if os.path.exists(self.excel_file):
+            self._wb = load_workbook(self.excel_file, read_only=False, keep_links=False)
+            self._ws = self._wb.active
+            # Read the URL column once per run; values_only skips building Cell objects
+            if self._existing_urls is None:
+                self._existing_urls = {
+                    r[0] for r in self._ws.iter_rows(min_row=2, min_col=4, max_col=4, values_only=True) if r[0]
+                }
+        else:
+            # A fresh file is streamed to disk instead of building the full cell tree
+            self._wb = Workbook(write_only=True)
+            self._ws = self._wb.create_sheet("IMDb TV Series")
+            self._existing_urls = set()
+        
+        # Fixed widths; write-only sheets need them before the first row
+        for column, width in COLUMN_WIDTHS.items():
+            self._ws.column_dimensions[column].width = width
+        
+        if self._wb.write_only:
+            header_cells = self._bordered_cells(self._ws, ["Title", "Rating", "Genres", "URL"])
+            styles = _excel_styles()
+            for cell in header_cells:
+                cell.font = styles['header_font']
+                cell.fill = styles['header_fill']
+                cell.alignment = styles['header_alignment']
+            self._ws.append(header_cells)
+        
+        # Pending rows are still saved if the run ends without close() (e.g. a crash)
+        if not self._flush_at_exit:
+            atexit.register(self.flush_excel)
+            self._flush_at_exit = True
+
+    def save_many_to_excel(self, rows):
+        """Append several results to the open workbook; returns the number of rows added"""
         try:
-            if os.path.exists(self.excel_file):
-                wb = load_workbook(self.excel_file)
-                ws = wb.active
-                
-                # Check if this series already exists in the file
-                existing_urls = [row[3].value for row in ws.iter_rows(min_row=2, max_col=4)]
-                if data['url'] in existing_urls:
+            self._open_workbook()
+            
+            # Skip series already in the file (or added earlier in this run)
+            added = 0
+            for data in rows:
+                if data['url'] in self._existing_urls:
                     print(f"ℹ️ Series '{data['title']}' already exists in the Excel file")
-                    return False
-            else:
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "IMDb TV Series"
-                
-                # Define headers
-                headers = ["Title", "Rating", "Genres", "URL"]
-                for col_num, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_num)
-                    cell.value = header
-                    cell.font = Font(name='Arial', size=12, bold=True, color="FFFFFF")
-                    cell.fill = PatternFill(start_color="0066CC", end_color="0066CC", fill_type="solid")
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                    cell.border = Border(
-                        left=Side(style='thin'),
-                        right=Side(style='thin'),
-                        top=Side(style='thin'),
-                        bottom=Side(style='thin')
-                    )
-            
-            # Add new data
-            new_row = [
-                data['title'],
-                data['rating'],
-                data['genres'],
-                data['url']
-            ]
-            ws.append(new_row)
-            
-            # Apply borders to new row
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            for col_num in range(1, 5):
-                ws.cell(row=ws.max_row, column=col_num).border = border
-            
-            # Auto-adjust column widths
-            for col in ws.columns:
-                max_length = 0
-                column = col[0].column_letter
-                for cell in col:
-                    if cell.value:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                adjusted_width = (max_length + 2) if max_length < 50 else 50
-                ws.column_dimensions[column].width = adjusted_width
-            
-            wb.save(self.excel_file)
+                    continue
+                self._existing_urls.add(data['url'])
+                self._ws.append(self._bordered_cells(self._ws, [
+                    data['title'],
+                    data['rating'],
+                    data['genres'],
+                    data['url']
+                ]))
+                added += 1
+            
+            if added:
+                self._dirty = True
+            return added
+            
+        except Exception as e:
+            print(f"\n❌ Error saving Excel file: {str(e)}")
+            return 0
+
+    def flush_excel(self):
+        """Write the pending rows to the Excel file in a single save"""
+        if not self._dirty:
+            return False
+        try:
+            self._wb.save(self.excel_file)
             print(f"✅ Data successfully saved to '{self.excel_file}'")
             return True
             
         except Exception as e:
             print(f"\n❌ Error saving Excel file: {str(e)}")
+            # The unsaved URLs must not count as already present
+            self._existing_urls = None
             return False
+        finally:
+            # A write-only workbook can only be saved once, so reopen on the next write;
+            # the URL set stays valid because the file now holds those rows
+            self._wb = self._ws = None
+            self._dirty = False
 
 
 def main():
@@ -189,19 +600,23 @@ def main():
     parser.add_argument('series', nargs='+', help="Name of the TV series to search")
     parser.add_argument('--excel', '-e', help="Specify Excel filename for output (optional)")
     parser.add_argument('--multiple', '-m', action='store_true', help="Search for multiple series separated by commas")
+    parser.add_argument('--no-save', '-n', action='store_true', help="Do not write to Excel")
     args = parser.parse_args()
     
     excel_file = args.excel if args.excel else "imdb_series_data.xlsx"
-    scraper = IMDBSeriesScraper(excel_file)
+    with IMDBSeriesScraper(excel_file) as scraper:
     
-    if args.multiple:
-        series_list = ' '.join(args.series).split(',')
-        series_list = [s.strip() for s in series_list]
+        if args.multiple:
+            # Drop blanks and case-insensitive repeats, keeping the first spelling of each
+            unique_series = {}
+            for s in ' '.join(args.series).split(','):
+                if s.strip():
+                    unique_series.setdefault(s.strip().casefold(), s.strip())
+            series_list = list(unique_series.values())
         
-        print(f"Searching for {len(series_list)} series...")
-        for series_name in series_list:
-            result = scraper.get_series_rating_by_name(series_name)
-            if result:
+            def report(series_name, result):
+                if not result:
+                    return
                 print("\n" + "="*50)
                 print(f"📺 Title: {result['title']}")
                 print(f"🎭 Genres: {result['genres']}")
@@ -209,22 +624,30 @@ def main():
                 print(f"🔗 URL: {result['url']}")
                 print("="*50 + "\n")
                 
-                # Save each result immediately
-                scraper.save_to_excel(result)
-    else:
-        series_name = ' '.join(args.series)
-        result = scraper.get_series_rating_by_name(series_name)
+                # Add each result to the open workbook as it arrives; the file is saved once on exit
+                if not args.no_save:
+                    scraper.save_to_excel(result)
+            
+            print(f"Searching for {len(series_list)} series...")
+            results = scraper.get_many_series_ratings(series_list, on_result=report)
+            for series_name, result in zip(series_list, results):
+                if isinstance(result, Exception):
+                    print(f"\n❌ Error fetching '{series_name}': {str(result)}")
+        else:
+            series_name = ' '.join(args.series)
+            result = scraper.get_series_rating_by_name(series_name)
         
-        if result:
-            print("\n" + "="*50)
-            print(f"📺 Title: {result['title']}")
-            print(f"🎭 Genres: {result['genres']}")
-            print(f"⭐ Rating: {result['rating']}/10")
-            print(f"🔗 URL: {result['url']}")
-            print("="*50 + "\n")
-            
-            # Save the result
-            scraper.save_to_excel(result)
+            if result:
+                print("\n" + "="*50)
+                print(f"📺 Title: {result['title']}")
+                print(f"🎭 Genres: {result['genres']}")
+                print(f"⭐ Rating: {result['rating']}/10")
+                print(f"🔗 URL: {result['url']}")
+                print("="*50 + "\n")
+            
+                # Save the result
+                if not args.no_save:
+                    scraper.save_to_excel(result)
 
 if __name__ == "__main__":
     main()